@@ -0,0 +1,14 @@
+from setuptools import setup
+
+# The C scanner is an optional accelerator: build it when Cython is
+# available, otherwise install as pure Python and let core.py fall back to
+# the regex tokenizer. All other metadata lives in pyproject.toml.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["src/suokif_compiler/_scanner.pyx"], language_level=3
+    )
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
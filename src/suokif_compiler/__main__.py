@@ -12,20 +12,22 @@ def main():
 
     args = parser.parse_args()
 
-    compiler = Compiler()
+    compiler = Compiler(track_source=args.show_original)
     try:
         result = compiler.compile_file(args.file, args.start_line, args.end_line)
         if args.find_symbol:
             usages = compiler.find_symbol_usages(args.find_symbol)
             print(f"Found {len(usages)} expressions containing symbol '{args.find_symbol}':")
             for node in usages:
-                if args.show_original and node.source_text:
-                    print(f"Original: {node.source_text.strip()}")
+                source = compiler.get_source_text(node) if args.show_original else None
+                if source:
+                    print(f"Original: {source.strip()}")
                 print(f"Translated: {node}")
         else:
             for node in result:
-                if args.show_original and node.source_text:
-                    print(f"Original: {node.source_text.strip()}")
+                source = compiler.get_source_text(node) if args.show_original else None
+                if source:
+                    print(f"Original: {source.strip()}")
                 print(f"Translated: {node}")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
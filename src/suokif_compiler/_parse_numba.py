@@ -0,0 +1,78 @@
+"""
+Optional Numba-accelerated structure planning for the parse loop.
+
+The parser's hot loop mixes two jobs: integer bookkeeping (paren matching,
+expression spans) and Python object construction. Only the first is
+JIT-friendly, so it is split out here: plan_parse walks a preclassified
+kinds array and fills a parent-link buffer using nothing but integer
+indexing, which Numba compiles to a tight native loop. core.py then
+materializes AST nodes from the validated plan in pure Python.
+
+Numba is an optional dependency: when it is missing, plan_parse is a plain
+Python function with identical semantics and core.py skips the planned
+path entirely.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    np = None
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so plan_parse stays importable without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+
+from array import array
+
+# plan_parse status codes.
+PLAN_OK = 0
+PLAN_UNEXPECTED_CLOSE = 1
+PLAN_UNCLOSED_OPEN = 2
+
+# Token kinds, as preclassified by the tokenizer caller.
+KIND_OPEN = 0
+KIND_CLOSE = 1
+KIND_ATOM = 2
+
+
+def make_int_buffer(n: int):
+    """Returns a writable int32 buffer of length n for plan_parse output."""
+    if np is not None:
+        return np.empty(n, dtype=np.int32)
+    return array('i', bytes(4 * n))
+
+
+@njit(cache=True)
+def plan_parse(kinds, parent, stack):
+    """
+    Computes expression structure from per-token kinds (0='(', 1=')', 2=atom).
+
+    Fills parent[i] with the token index of the '(' opening the enclosing
+    expression (-1 at top level); for a ')' token, parent[i] is the '(' it
+    closes. stack is caller-provided scratch space of the same length.
+    Returns PLAN_OK, PLAN_UNEXPECTED_CLOSE or PLAN_UNCLOSED_OPEN.
+    """
+    sp = 0
+    for i in range(len(kinds)):
+        k = kinds[i]
+        if k == 0:
+            parent[i] = stack[sp - 1] if sp > 0 else -1
+            stack[sp] = i
+            sp += 1
+        elif k == 1:
+            if sp == 0:
+                return 1
+            sp -= 1
+            parent[i] = stack[sp]
+        else:
+            parent[i] = stack[sp - 1] if sp > 0 else -1
+    if sp != 0:
+        return 2
+    return 0
@@ -0,0 +1,83 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Hand-written scanner for SUO-KIF source.
+
+Walks the byte buffer once with a character switch and emits the same
+(texts, starts, ends) structure-of-arrays as the regex tokenizer in
+core.py, without the regex engine or per-match method-call overhead. The module
+is only built when Cython is available; core.py falls back to the regex
+tokenizer otherwise.
+"""
+from array import array
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+from cpython.unicode cimport PyUnicode_FromStringAndSize
+
+
+cdef inline bint _is_space(char c):
+    return c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b'\v'
+
+
+def scan(bytes text):
+    """
+    Tokenizes the byte buffer into Lisp-like tokens.
+    Returns (texts, starts, ends) with offsets packed into int32 arrays.
+
+    Comments (';' to end of line) are dropped, matching the regex path.
+    """
+    cdef const char* buf = PyBytes_AS_STRING(text)
+    cdef Py_ssize_t n = PyBytes_GET_SIZE(text)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t s
+    cdef char c
+    texts = []
+    starts = []
+    ends = []
+    append_text = texts.append
+    append_start = starts.append
+    append_end = ends.append
+    while i < n:
+        c = buf[i]
+        if _is_space(c):
+            i += 1
+        elif c == b'(' or c == b')':
+            append_text(PyUnicode_FromStringAndSize(buf + i, 1))
+            append_start(i)
+            append_end(i + 1)
+            i += 1
+        elif c == b';':
+            # Comment: skip to end of line.
+            while i < n and buf[i] != b'\n':
+                i += 1
+        elif c == b'"':
+            s = i
+            i += 1
+            while i < n and buf[i] != b'"':
+                i += 1
+            if i < n:
+                i += 1  # include the closing quote
+            else:
+                # Unterminated string: the regex path's string alternative
+                # fails without a closing quote and the atom alternative
+                # matches instead, so rescan as an atom ending at the next
+                # delimiter.
+                i = s + 1
+                while i < n:
+                    c = buf[i]
+                    if _is_space(c) or c == b'(' or c == b')':
+                        break
+                    i += 1
+            append_text(PyUnicode_FromStringAndSize(buf + s, i - s))
+            append_start(s)
+            append_end(i)
+        else:
+            s = i
+            while i < n:
+                c = buf[i]
+                if _is_space(c) or c == b'(' or c == b')':
+                    break
+                i += 1
+            append_text(PyUnicode_FromStringAndSize(buf + s, i - s))
+            append_start(s)
+            append_end(i)
+    return texts, array('i', starts), array('i', ends)
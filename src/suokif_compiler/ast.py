@@ -1,111 +1,239 @@
 from dataclasses import dataclass, field
-from typing import List, Any, Optional
-
-@dataclass
+from typing import Any, List, Sequence
+
+# Kind tags: hot paths compare a node's KIND attribute against these ints
+# instead of calling isinstance(), replacing an MRO walk with an attribute
+# read and an integer compare. Operator subclasses occupy the contiguous
+# range starting at KIND_OPERATOR_MIN so "is this an operator" is a single
+# >= comparison.
+KIND_NODE = 0
+KIND_SYMBOL = 1
+KIND_VARIABLE = 2
+KIND_STRING = 3
+KIND_NUMBER = 4
+KIND_BOOLEAN = 5
+KIND_EXPRESSION = 6
+KIND_OPERATOR_MIN = 7
+
+@dataclass(slots=True)
 class ASTNode:
-    """Base class for all AST nodes."""
-    # source_text is populated after parsing to hold the original string slice
-    source_text: Optional[str] = field(default=None, init=False, repr=False)
-
-@dataclass
+    """
+    Base class for all AST nodes.
+
+    Nodes deliberately carry no source location: the original string slice
+    for a node is cold data that only the --show-original path needs, so the
+    Compiler keeps it in a sidecar table (see Compiler.get_source_text)
+    instead of spending a slot on every node.
+    """
+    KIND = KIND_NODE
+
+    def _repr_into(self, out: List[str]) -> None:
+        """
+        Appends this node's repr fragments to a shared buffer.
+
+        Container nodes override this so a whole-AST repr is built in one
+        list and joined once, instead of each nested repr materializing its
+        own intermediate string (which is quadratic in the worst case).
+        """
+        out.append(repr(self))
+
+@dataclass(slots=True)
 class Value(ASTNode):
-    """Base class for literal values."""
+    """
+    Base class for literal values.
+
+    Only the parsed content is stored: a literal's own source text is
+    either identical to content (strings) or derivable from the sidecar
+    span table when source tracking is on, so keeping a second string
+    per node would just duplicate it.
+    """
     content: Any
-    original_text: str
 
-@dataclass
+@dataclass(slots=True)
 class String(Value):
     """Represents a string literal."""
+    KIND = KIND_STRING
+    def _repr_into(self, out: List[str]) -> None:
+        out.append(f"String({self.content})")
+
     def __repr__(self) -> str:
-        return f"String({self.original_text})"
+        return f"String({self.content})"
 
-@dataclass
+@dataclass(slots=True)
 class Number(Value):
     """Represents a numeric literal."""
+    KIND = KIND_NUMBER
+    def _repr_into(self, out: List[str]) -> None:
+        out.append(f"Number({self.content})")
+
     def __repr__(self) -> str:
         return f"Number({self.content})"
 
-@dataclass
+@dataclass(slots=True)
 class Boolean(Value):
     """Represents a boolean literal."""
+    KIND = KIND_BOOLEAN
+    def _repr_into(self, out: List[str]) -> None:
+        out.append(f"Boolean({self.content})")
+
     def __repr__(self) -> str:
         return f"Boolean({self.content})"
 
-@dataclass
+@dataclass(slots=True)
 class Symbol(ASTNode):
     """Represents a symbol identifier."""
+    KIND = KIND_SYMBOL
     name: str
 
+    def _repr_into(self, out: List[str]) -> None:
+        out.append(f"Symbol({self.name})")
+
     def __repr__(self) -> str:
         return f"Symbol({self.name})"
 
-@dataclass
+@dataclass(slots=True)
 class Variable(ASTNode):
     """Represents a variable identifier (starts with ?)."""
+    KIND = KIND_VARIABLE
     name: str
 
     def __post_init__(self):
-        if self.name.startswith('?'):
+        # Single-char compare beats startswith() — no method call or
+        # argument parsing, and this runs for every variable occurrence.
+        if self.name and self.name[0] == '?':
             self.name = self.name[1:]
 
+    def _repr_into(self, out: List[str]) -> None:
+        out.append(f"Variable({self.name})")
+
     def __repr__(self) -> str:
         return f"Variable({self.name})"
 
-@dataclass
+@dataclass(slots=True)
 class Expression(ASTNode):
     """Represents a nested list of terms (S-expression)."""
-    children: List[ASTNode] = field(default_factory=list)
+    KIND = KIND_EXPRESSION
+    # A list while the parser is appending; frozen to a tuple once the
+    # parse finishes, since ASTs are read-only afterwards and tuples are
+    # smaller and faster to iterate.
+    children: Sequence[ASTNode] = field(default_factory=list)
+
+    def _repr_into(self, out: List[str]) -> None:
+        children = self.children
+        if children and children[0].KIND == KIND_SYMBOL:
+            out.append(children[0].name)
+            out.append("(")
+            rest = children[1:]
+        else:
+            out.append("Expression([")
+            rest = children
+        first = True
+        for child in rest:
+            if first:
+                first = False
+            else:
+                out.append(", ")
+            child._repr_into(out)
+        out.append(")" if children and children[0].KIND == KIND_SYMBOL else "])")
 
     def __repr__(self) -> str:
-        if self.children and isinstance(self.children[0], Symbol):
-            func_name = self.children[0].name
-            args = ", ".join(repr(c) for c in self.children[1:])
-            return f"{func_name}({args})"
-        return f"Expression({self.children})"
+        buf: List[str] = []
+        self._repr_into(buf)
+        return "".join(buf)
 
-@dataclass
+@dataclass(slots=True)
 class Operator(Expression):
     """Base class for SUO-KIF operators."""
+    def _repr_into(self, out: List[str]) -> None:
+        out.append(self.__class__.__name__)
+        out.append("(")
+        first = True
+        for child in self.children:
+            if first:
+                first = False
+            else:
+                out.append(", ")
+            child._repr_into(out)
+        out.append(")")
+
     def __repr__(self) -> str:
-        args = ", ".join(repr(c) for c in self.children)
-        return f"{self.__class__.__name__}({args})"
+        buf: List[str] = []
+        self._repr_into(buf)
+        return "".join(buf)
 
-@dataclass
+@dataclass(slots=True)
 class Conditional(Operator):
     """Represents the conditional operator (=>)."""
-    pass
+    KIND = KIND_OPERATOR_MIN
+    TOKEN = "=>"
 
-@dataclass
+@dataclass(slots=True)
 class Biconditional(Operator):
     """Represents the biconditional operator (<=>)."""
-    pass
+    KIND = KIND_OPERATOR_MIN + 1
+    TOKEN = "<=>"
 
-@dataclass
+@dataclass(slots=True)
 class And(Operator):
     """Represents the boolean and operator."""
-    pass
+    KIND = KIND_OPERATOR_MIN + 2
+    TOKEN = "and"
 
-@dataclass
+@dataclass(slots=True)
 class Or(Operator):
     """Represents the boolean or operator."""
-    pass
+    KIND = KIND_OPERATOR_MIN + 3
+    TOKEN = "or"
 
-@dataclass
+@dataclass(slots=True)
 class Not(Operator):
     """Represents the boolean not operator."""
-    pass
+    KIND = KIND_OPERATOR_MIN + 4
+    TOKEN = "not"
 
-@dataclass
+@dataclass(slots=True)
 class Exists(Operator):
     """Represents the existential quantifier (exists)."""
-    pass
+    KIND = KIND_OPERATOR_MIN + 5
+    TOKEN = "exists"
 
-@dataclass
+@dataclass(slots=True)
 class Eq(Operator):
     """Represents the equality operator"""
-    pass
+    KIND = KIND_OPERATOR_MIN + 6
+    TOKEN = "="
 
-@dataclass
+@dataclass(slots=True)
 class ForAll(Operator):
     """Represents the universal quantifier (forall)"""
-    pass
\ No newline at end of file
+    KIND = KIND_OPERATOR_MIN + 7
+    TOKEN = "forall"
+
+# @dataclass regenerates __repr__ on each operator subclass (none of them
+# define one in their own body), which would shadow the buffered Operator
+# implementation; point them back at it.
+for _cls in (Conditional, Biconditional, And, Or, Not, Exists, Eq, ForAll):
+    _cls.__repr__ = Operator.__repr__
+del _cls
+
+def _operator_tag(cls: type) -> Operator:
+    """
+    Creates a shared, effectively-frozen instance of an Operator subclass.
+
+    The parser pushes these tags onto its stack to mark which operator an
+    open expression belongs to, then builds the real Operator node when the
+    expression is closed. Interning them avoids allocating a fresh dataclass
+    instance for every operator occurrence.
+    """
+    tag = cls.__new__(cls)
+    tag.children = ()
+    return tag
+
+# Built by scanning Operator subclasses for a TOKEN attribute, so adding a
+# new operator is just defining the subclass with its TOKEN — no change to
+# atom dispatch is needed.
+OPERATOR_TAGS = {
+    cls.TOKEN: _operator_tag(cls)
+    for cls in Operator.__subclasses__()
+    if hasattr(cls, "TOKEN")
+}
\ No newline at end of file
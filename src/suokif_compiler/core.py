@@ -1,19 +1,108 @@
+import os
 import re
-from typing import List, Optional
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from .ast import (
     ASTNode, Value, Symbol, Variable, Expression, String, Number, Boolean,
     Operator, Conditional, Biconditional, And, Or, Not, Exists, ForAll,
-    Eq
+    Eq, OPERATOR_TAGS, KIND_SYMBOL, KIND_EXPRESSION, KIND_OPERATOR_MIN
 )
 from .symbol_table import SymbolTable
+from . import _parse_numba
+
+# Below this many tokens the planned parse isn't worth the extra buffers
+# (and, on first call, the JIT compilation).
+_NUMBA_MIN_TOKENS = 4096
+
+# Below this input size the cost of forking worker processes and pickling
+# results outweighs the parallel parse.
+_PARALLEL_MIN_BYTES = 1 << 20
+
+
+def _compile_chunk(text: str):
+    """
+    Worker entry point for compile_file_parallel: compiles one chunk in a
+    fresh Compiler and returns its (ast, symbol_table) for merging.
+    """
+    compiler = Compiler()
+    ast = compiler.compile(text)
+    return ast, compiler.symbol_table
+
+# Interned atoms: keywords map to shared instances instead of allocating a
+# fresh node per occurrence. Operator entries are transient parser tags (the
+# real Operator node is built when the expression closes); booleans are
+# immutable values and can be shared outright.
+_TRUE = Boolean(content=True)
+_FALSE = Boolean(content=False)
+
+_KEYWORDS = dict(OPERATOR_TAGS)
+_KEYWORDS["true"] = _TRUE
+_KEYWORDS["false"] = _FALSE
+_INTERNED_IDS = frozenset(id(node) for node in _KEYWORDS.values())
+
+# The operator tags alone: they are parser-internal and must never appear in
+# an emitted AST, unlike the boolean singletons, which are immutable values
+# and safe to share.
+_OPERATOR_TAG_IDS = frozenset(id(tag) for tag in OPERATOR_TAGS.values())
+
+# Compiled once at import: a comment, a string literal, a paren, or a run of
+# non-delimiter characters. Keeping it at module scope skips the re-cache
+# lookup that re.compile performs on every _tokenize call.
+_TOKEN_RE = re.compile(r';[^\n]*|"[^"]*"|\(|\)|[^\s()]+')
+
+# Matches every literal float() accepts for KIF numerics; pre-checking with
+# this avoids raising ValueError on every plain symbol.
+_NUM_RE = re.compile(r'[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$')
+
+def _make_string(token: str) -> ASTNode:
+    return String(content=token)
+
+def _make_variable(token: str) -> ASTNode:
+    return Variable(name=token)
+
+def _make_number(token: str) -> ASTNode:
+    # Most KIF numerics are integers (arities, indices): probe with
+    # isdecimal and parse via int(), which is a C-level scan that returns
+    # an unboxed-friendly int instead of always going through float().
+    body = token[1:] if token[0] in '+-' else token
+    if body.isdecimal():
+        return Number(content=int(token))
+    if _NUM_RE.match(token):
+        return Number(content=float(token))
+    return Symbol(name=token)
+
+# Jump table indexed by a token's first character: strings, variables and
+# numbers are fully determined by it, so one list index replaces the
+# sequential prefix checks (and the float() try/except) for those atoms.
+_FIRST_CHAR_HANDLERS = [None] * 128
+for _c in '"`':
+    _FIRST_CHAR_HANDLERS[ord(_c)] = _make_string
+_FIRST_CHAR_HANDLERS[ord('?')] = _make_variable
+for _c in '0123456789+-.':
+    _FIRST_CHAR_HANDLERS[ord(_c)] = _make_number
+del _c
+
+try:
+    from . import _scanner  # compiled Cython scanner (optional)
+except ImportError:
+    _scanner = None
 
 class Compiler:
     """
     Main class for the SUO-KIF Compiler.
     """
-    def __init__(self):
+    def __init__(self, track_source: bool = False):
         self.ast: List[ASTNode] = []
         self.symbol_table = SymbolTable()
+        # Source spans are cold data most consumers never read, so they live
+        # in a sidecar table keyed by node id rather than on every node.
+        # They are only recorded when track_source is set.
+        self.track_source = track_source
+        self._source_spans: Dict[int, Tuple[int, int]] = {}
+        self._source_text: str = ""
+        # Memoized find_symbol_usages results; cleared on every compile.
+        self._symbol_cache: Dict[str, Tuple[ASTNode, ...]] = {}
 
     def compile(self, kif_string: str) -> List[ASTNode]:
         """
@@ -27,24 +116,56 @@ class Compiler:
         """
         if not kif_string:
             raise ValueError("Input cannot be empty")
-        
+
+        self._source_spans.clear()
+        self._symbol_cache.clear()
+        self._source_text = kif_string if self.track_source else ""
+        self.symbol_table = SymbolTable()
         tokens = self._tokenize(kif_string)
-        self.ast = self._parse(tokens, kif_string)
-        self._build_symbol_table(self.ast)
-        
+        # _parse records symbol references as expressions close, so no
+        # separate AST traversal is needed to build the symbol table.
+        self.ast = self._parse(tokens)
+
         return self.ast
 
-    def find_symbol_usages(self, symbol_name: str) -> List[ASTNode]:
+    def find_symbol_usages(self, symbol_name: str) -> Tuple[ASTNode, ...]:
         """
         Finds all expressions containing the specified symbol.
 
+        Results are memoized per compile, so repeated queries for the same
+        symbol are a single dict hit. The returned tuple is immutable so
+        callers cannot mutate the cached entry.
+
         Args:
             symbol_name (str): The name of the symbol to find.
 
         Returns:
-            List[ASTNode]: A list of AST nodes where the symbol appears.
+            Tuple[ASTNode, ...]: The AST nodes where the symbol appears.
+        """
+        cached = self._symbol_cache.get(symbol_name)
+        if cached is None:
+            cached = tuple(self.symbol_table.get_references(symbol_name))
+            self._symbol_cache[symbol_name] = cached
+        return cached
+
+    def get_source_text(self, node: ASTNode) -> Optional[str]:
         """
-        return self.symbol_table.get_references(symbol_name)
+        Returns the original source slice for a node, if one was recorded.
+
+        Spans are only recorded when the compiler was created with
+        track_source=True; interned atoms (operators, booleans) share one
+        instance and have no span of their own.
+
+        Args:
+            node (ASTNode): A node from the most recent compile.
+
+        Returns:
+            Optional[str]: The source text, or None if not tracked.
+        """
+        span = self._source_spans.get(id(node))
+        if span is None:
+            return None
+        return self._source_text[span[0]:span[1]]
 
     def compile_file(self, file_path: str, start_line: int = 1, end_line: Optional[int] = None) -> List[ASTNode]:
         """
@@ -55,109 +176,285 @@ class Compiler:
             start_line (int): The starting line number (1-based, inclusive).
             end_line (Optional[int]): The ending line number (1-based, inclusive).
 
+        Returns:
+            List[ASTNode]: The compiled output.
+        """
+        if start_line <= 1 and end_line is None:
+            # Whole-file read: no need to materialize a per-line list.
+            with open(file_path, 'r', encoding="utf-8") as f:
+                return self.compile(f.read())
+
+        with open(file_path, 'r', encoding="utf-8") as f:
+            buf = []
+            for lineno, line in enumerate(f, 1):
+                if lineno < start_line:
+                    continue
+                if end_line is not None and lineno > end_line:
+                    break
+                buf.append(line)
+        return self.compile("".join(buf))
+
+    def compile_file_parallel(self, file_path: str, workers: Optional[int] = None) -> List[ASTNode]:
+        """
+        Compiles a SUO-KIF file using a pool of worker processes.
+
+        KIF files are splittable at any newline where the paren depth is
+        zero, so the file is cut into roughly equal chunks at such points
+        and each chunk is parsed in its own process; the resulting ASTs are
+        concatenated and the symbol tables merged. Small inputs (or a
+        single resulting chunk) fall back to the serial path, where fork
+        overhead would dominate. Source tracking is not supported here.
+
+        Args:
+            file_path (str): Path to the .kif file.
+            workers (Optional[int]): Process count; defaults to cpu_count.
+
         Returns:
             List[ASTNode]: The compiled output.
         """
         with open(file_path, 'r', encoding="utf-8") as f:
-            lines = f.readlines()
+            text = f.read()
 
-        start_idx = max(0, start_line - 1)
-        subset = lines[start_idx:end_line] if end_line is not None else lines[start_idx:]
-        return self.compile("".join(subset))
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if len(text) < _PARALLEL_MIN_BYTES or workers <= 1:
+            return self.compile(text)
 
-    def _tokenize(self, text: str) -> List[tuple]:
+        chunks = self._split_at_depth_zero(text, workers)
+        if len(chunks) <= 1:
+            return self.compile(text)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_compile_chunk, chunks))
+
+        self._source_spans.clear()
+        self._symbol_cache.clear()
+        self._source_text = ""
+        self.ast = []
+        self.symbol_table = SymbolTable()
+        for chunk_ast, chunk_table in results:
+            self.ast.extend(chunk_ast)
+            self.symbol_table.merge(chunk_table)
+        return self.ast
+
+    @staticmethod
+    def _split_at_depth_zero(text: str, workers: int) -> List[str]:
+        """
+        Splits text into at most `workers` chunks, cutting only at newlines
+        where the paren depth is zero (outside strings and comments) so
+        every chunk holds complete top-level S-expressions.
+        """
+        n = len(text)
+        split_points: List[int] = []
+        depth = 0
+        i = 0
+        while i < n:
+            ch = text[i]
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+            elif ch == '"':
+                closing = text.find('"', i + 1)
+                i = n if closing == -1 else closing
+            elif ch == ';':
+                newline = text.find('\n', i)
+                i = n if newline == -1 else newline
+                continue  # let the newline be handled normally
+            elif ch == '\n' and depth == 0:
+                split_points.append(i + 1)
+            i += 1
+
+        chunks: List[str] = []
+        target = n / workers
+        prev = 0
+        next_cut = target
+        for point in split_points:
+            if point >= next_cut and point > prev:
+                chunks.append(text[prev:point])
+                prev = point
+                next_cut = prev + target
+        if prev < n:
+            chunks.append(text[prev:])
+        return [chunk for chunk in chunks if chunk.strip()]
+
+    def _tokenize(self, text: str) -> Tuple[List[str], array, array]:
         """
         Tokenizes the input string into Lisp-like tokens.
-        Returns a list of (token_text, start_index, end_index).
+
+        Returns (texts, starts, ends): the token strings plus two parallel
+        int32 arrays of offsets. Packing offsets into contiguous arrays
+        instead of one tuple per token cuts per-token memory roughly 3x and
+        makes iteration in _parse an index read rather than tuple unpacking.
         """
-        token_pattern = re.compile(r';[^\n]*|"[^"]*"|\(|\)|[^\s()]+')
-        tokens = []
-        for match in token_pattern.finditer(text):
+        if _scanner is not None:
+            data = text.encode("utf-8")
+            if len(data) == len(text):
+                # ASCII input, so byte offsets match character offsets and
+                # the C scanner produces identical (texts, starts, ends).
+                return _scanner.scan(data)
+        texts: List[str] = []
+        starts = array('i')
+        ends = array('i')
+        append_text = texts.append
+        append_start = starts.append
+        append_end = ends.append
+        for match in _TOKEN_RE.finditer(text):
             token_text = match.group()
-            if not token_text.startswith(';'):
-                tokens.append((token_text, match.start(), match.end()))
-        return tokens
+            if token_text[0] != ';':
+                append_text(token_text)
+                append_start(match.start())
+                append_end(match.end())
+        return texts, starts, ends
 
-    def _parse(self, tokens: List[tuple], original_text: str) -> List[ASTNode]:
-        """Parses a list of tokens into a list of ASTNodes."""
+    def _parse(self, tokens: Tuple[List[str], array, array]) -> List[ASTNode]:
+        """
+        Parses tokenized (texts, starts, ends) input into a list of ASTNodes,
+        recording symbol references into the symbol table as each expression
+        closes (single pass; no separate AST traversal afterwards).
+        """
+        texts, token_starts, token_ends = tokens
+        if _parse_numba.HAVE_NUMBA and len(texts) >= _NUMBA_MIN_TOKENS:
+            return self._parse_planned(tokens)
         stack: List[List[ASTNode]] = [[]]
         starts: List[int] = []  # Track start indices of open expressions
-        
-        for token, start, end in tokens:
+        track = self.track_source
+        spans = self._source_spans
+        table = self.symbol_table.table
+
+        for i in range(len(texts)):
+            token = texts[i]
             if token == '(':
                 new_expr: List[ASTNode] = []
                 stack.append(new_expr)
-                starts.append(start)
+                starts.append(token_starts[i])
             elif token == ')':
                 if len(stack) <= 1:
                     raise ValueError("Unexpected ')'")
                 finished_expr_list = stack.pop()
                 expr_start = starts.pop()
-                
+
                 node = None
-                if finished_expr_list and isinstance(finished_expr_list[0], Operator):
-                    node = finished_expr_list[0]
-                    node.children = finished_expr_list[1:]
+                if finished_expr_list and finished_expr_list[0].KIND >= KIND_OPERATOR_MIN:
+                    node = type(finished_expr_list[0])(children=finished_expr_list[1:])
                 else:
                     node = Expression(children=finished_expr_list)
-                
-                node.source_text = original_text[expr_start:end]
+
+                for child in node.children:
+                    if child.KIND == KIND_SYMBOL:
+                        table[child.name].append(node)
+
+                if track:
+                    spans[id(node)] = (expr_start, token_ends[i])
                 stack[-1].append(node)
             else:
                 atom = self._create_atom(token)
-                atom.source_text = original_text[start:end]
+                if id(atom) in _OPERATOR_TAG_IDS and (len(stack) == 1 or stack[-1]):
+                    # Operator keyword outside head position: the shared tag
+                    # must not escape into the AST, so allocate a real node.
+                    atom = type(atom)()
+                if track and id(atom) not in _INTERNED_IDS:
+                    spans[id(atom)] = (token_starts[i], token_ends[i])
                 stack[-1].append(atom)
-        
+
         if len(stack) != 1:
             raise ValueError("Unclosed '('")
+
+        # Top-level symbols have no enclosing expression; they reference
+        # themselves, matching the old traversal's behavior.
+        for node in stack[0]:
+            if node.KIND == KIND_SYMBOL:
+                table[node.name].append(node)
+        self._freeze_children(stack[0])
         return stack[0]
 
+    def _parse_planned(self, tokens: Tuple[List[str], array, array]) -> List[ASTNode]:
+        """
+        Parse via the Numba structure planner: paren matching and span
+        bookkeeping run as a JIT-compiled integer loop over a kinds array,
+        then nodes are materialized in Python from the validated plan (so
+        the materialization loop needs no per-token error checks).
+        """
+        texts, token_starts, token_ends = tokens
+        n = len(texts)
+        kinds = _parse_numba.make_int_buffer(n)
+        for i in range(n):
+            t = texts[i]
+            kinds[i] = 0 if t == '(' else 1 if t == ')' else 2
+        parent = _parse_numba.make_int_buffer(n)
+        scratch = _parse_numba.make_int_buffer(n)
+        status = _parse_numba.plan_parse(kinds, parent, scratch)
+        if status == _parse_numba.PLAN_UNEXPECTED_CLOSE:
+            raise ValueError("Unexpected ')'")
+        if status == _parse_numba.PLAN_UNCLOSED_OPEN:
+            raise ValueError("Unclosed '('")
+
+        track = self.track_source
+        spans = self._source_spans
+        table = self.symbol_table.table
+        stack: List[List[ASTNode]] = [[]]
+        for i in range(n):
+            k = kinds[i]
+            if k == 0:
+                stack.append([])
+            elif k == 1:
+                finished_expr_list = stack.pop()
+                if finished_expr_list and finished_expr_list[0].KIND >= KIND_OPERATOR_MIN:
+                    node = type(finished_expr_list[0])(children=finished_expr_list[1:])
+                else:
+                    node = Expression(children=finished_expr_list)
+
+                for child in node.children:
+                    if child.KIND == KIND_SYMBOL:
+                        table[child.name].append(node)
+
+                if track:
+                    # parent[i] is the index of the '(' this token closes.
+                    spans[id(node)] = (token_starts[parent[i]], token_ends[i])
+                stack[-1].append(node)
+            else:
+                atom = self._create_atom(texts[i])
+                if id(atom) in _OPERATOR_TAG_IDS and (len(stack) == 1 or stack[-1]):
+                    # Operator keyword outside head position: the shared tag
+                    # must not escape into the AST, so allocate a real node.
+                    atom = type(atom)()
+                if track and id(atom) not in _INTERNED_IDS:
+                    spans[id(atom)] = (token_starts[i], token_ends[i])
+                stack[-1].append(atom)
+
+        roots = stack[0]
+        for node in roots:
+            if node.KIND == KIND_SYMBOL:
+                table[node.name].append(node)
+        self._freeze_children(roots)
+        return roots
+
+    @staticmethod
+    def _freeze_children(roots: List[ASTNode]) -> None:
+        """
+        Converts every Expression's children list to a tuple. The AST is
+        read-only after parsing, and tuples drop the list header and
+        over-allocation slack (~30% per expression) while iterating faster.
+        """
+        stack = list(roots)
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            if node.KIND >= KIND_EXPRESSION:
+                node.children = tuple(node.children)
+                extend(node.children)
+
     def _create_atom(self, token: str) -> ASTNode:
         """Determines if a token is a Symbol, Variable, or Value."""
-        if token.startswith('"') or token.startswith('`'):
-            return String(content=token, original_text=token)
-        
-        if token.startswith('?'):
-            return Variable(name=token)
-
-        if token == "true":
-            return Boolean(content=True, original_text=token)
-        if token == "false":
-            return Boolean(content=False, original_text=token)
-
-        if token == "=>":
-            return Conditional()
-        if token == "<=>":
-            return Biconditional()
-        if token == "and":
-            return And()
-        if token == "or":
-            return Or()
-        if token == "not":
-            return Not()
-        if token == "exists":
-            return Exists()
-        if token == "=" :
-            return Eq()
-        if token == "forall" :
-            return ForAll()
-
-        try:
-            val = float(token)
-            return Number(content=val, original_text=token)
-        except ValueError:
-            return Symbol(name=token)
-
-    def _build_symbol_table(self, nodes: List[ASTNode]) -> None:
-        """Populates the symbol table by traversing the AST."""
-        self.symbol_table = SymbolTable()
-        for node in nodes:
-            self._traverse_and_collect(node, parent=None)
-
-    def _traverse_and_collect(self, node: ASTNode, parent: Optional[Expression]) -> None:
-        if isinstance(node, Expression):
-            for child in node.children:
-                self._traverse_and_collect(child, parent=node)
-        elif isinstance(node, Symbol):
-            ref_node = parent if parent else node
-            self.symbol_table.add_reference(node.name, ref_node)
\ No newline at end of file
+        first = ord(token[0])
+        if first < 128:
+            handler = _FIRST_CHAR_HANDLERS[first]
+            if handler is not None:
+                return handler(token)
+
+        interned = _KEYWORDS.get(token)
+        if interned is not None:
+            return interned
+
+        return Symbol(name=token)
@@ -1,20 +1,39 @@
-from typing import Dict, List
+from collections import defaultdict
+from typing import Dict, List, Sequence
 from .ast import ASTNode
 
 class SymbolTable:
     """
     Stores symbols and references to the AST nodes where they appear.
     """
+    __slots__ = ('table',)
+
     def __init__(self):
-        self.table: Dict[str, List[ASTNode]] = {}
+        # defaultdict needs a single hash lookup per reference, versus the
+        # two of an "if key not in dict" guard followed by the append.
+        self.table: Dict[str, List[ASTNode]] = defaultdict(list)
 
     def add_reference(self, symbol_name: str, node: ASTNode) -> None:
-        if symbol_name not in self.table:
-            self.table[symbol_name] = []
         self.table[symbol_name].append(node)
 
-    def get_references(self, symbol_name: str) -> List[ASTNode]:
-        return self.table.get(symbol_name, [])
+    def merge(self, other: "SymbolTable") -> None:
+        """Extends this table's reference lists with another table's."""
+        table = self.table
+        for symbol_name, references in other.table.items():
+            table[symbol_name].extend(references)
+
+    # Shared miss result: avoids allocating a fresh empty list per lookup.
+    _EMPTY: tuple = ()
+
+    def get_references(self, symbol_name: str) -> Sequence[ASTNode]:
+        """
+        Returns the nodes referencing symbol_name, or () if there are none.
+
+        The returned sequence is the live internal list (no defensive
+        copy); callers must not mutate it. Uses .get so that misses do not
+        insert empty entries into the defaultdict.
+        """
+        return self.table.get(symbol_name, self._EMPTY)
 
     def __repr__(self) -> str:
         return f"SymbolTable({list(self.table.keys())})"
\ No newline at end of file
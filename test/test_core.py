@@ -1,17 +1,91 @@
 import pytest
 from suokif_compiler import Compiler
+from suokif_compiler import core
 
 def test_compiler_initialization():
     compiler = Compiler()
     assert isinstance(compiler, Compiler)
-    assert compiler.rules == []
+    assert compiler.ast == []
 
 def test_compile_basic_string():
     compiler = Compiler()
     result = compiler.compile("(instance Mary Human)")
-    assert result == "Compiled: (instance Mary Human)"
+    assert repr(result) == "[instance(Symbol(Mary), Symbol(Human))]"
 
 def test_compile_empty_error():
     compiler = Compiler()
     with pytest.raises(ValueError):
-        compiler.compile("")
\ No newline at end of file
+        compiler.compile("")
+
+def test_track_source_spans():
+    compiler = Compiler(track_source=True)
+    result = compiler.compile('(instance Mary Human)\n(p 5 "s")')
+    assert compiler.get_source_text(result[0]) == "(instance Mary Human)"
+    assert compiler.get_source_text(result[1]) == '(p 5 "s")'
+    assert compiler.get_source_text(result[0].children[1]) == "Mary"
+
+    untracked = Compiler()
+    node = untracked.compile("(a b)")[0]
+    assert untracked.get_source_text(node) is None
+
+def test_find_symbol_usages_memoized():
+    compiler = Compiler()
+    compiler.compile("(instance Mary Human) (p Mary)")
+    first = compiler.find_symbol_usages("Mary")
+    assert isinstance(first, tuple)
+    assert len(first) == 2
+    # Repeat queries hit the cache and return the same tuple.
+    assert compiler.find_symbol_usages("Mary") is first
+    # Recompiling invalidates the cache.
+    compiler.compile("(q R)")
+    assert compiler.find_symbol_usages("Mary") == ()
+
+def test_operator_keyword_in_argument_position_is_not_shared():
+    first = Compiler().compile("(likes a and b)")
+    second = Compiler().compile("(likes a and b)")
+    assert first[0].children[2] is not second[0].children[2]
+
+def _write_sample(path, expressions):
+    lines = []
+    for i in range(expressions):
+        lines.append(
+            f"(instance Entity{i % 40} Class{i % 7}) ; comment with ( unbalanced"
+        )
+        lines.append('(=> (p ?X) (q ?X "string with ) paren"))')
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+def test_parallel_matches_serial(tmp_path, monkeypatch):
+    kif_file = tmp_path / "sample.kif"
+    _write_sample(kif_file, 500)
+    monkeypatch.setattr(core, "_PARALLEL_MIN_BYTES", 0)
+
+    serial = Compiler()
+    serial_ast = serial.compile_file(str(kif_file))
+    parallel = Compiler()
+    parallel_ast = parallel.compile_file_parallel(str(kif_file), workers=3)
+
+    assert repr(parallel_ast) == repr(serial_ast)
+    assert set(parallel.symbol_table.table) == set(serial.symbol_table.table)
+    for name, refs in serial.symbol_table.table.items():
+        assert len(parallel.symbol_table.table[name]) == len(refs)
+    # Merged references must be the same objects as the nodes in the AST,
+    # not pickled copies of them.
+    top_level_ids = {id(node) for node in parallel.ast}
+    references = parallel.symbol_table.get_references("instance")
+    assert references
+    for reference in references:
+        assert id(reference) in top_level_ids
+
+def test_split_at_depth_zero_ignores_strings_and_comments():
+    text = (
+        '(p "has a newline\n and ( paren")\n'
+        "; comment with ( only\n"
+        "(q r)\n"
+    )
+    chunks = Compiler._split_at_depth_zero(text, workers=8)
+    assert len(chunks) >= 2
+    # Every chunk must hold complete top-level expressions: each one parses
+    # on its own and nothing is lost or duplicated across the cuts.
+    asts = [Compiler().compile(chunk) for chunk in chunks]
+    assert sum(len(nodes) for nodes in asts) == 2
+    assert '"has a newline\n and ( paren"' in repr(asts[0])